@@ -8,19 +8,70 @@ the NeXus NXDL Classes chapter.
 
 # testing:  see file dev_nxdl2rst.py
 
-from collections import OrderedDict
-from html import parser as HTMLParser
+from html import unescape as _html_unescape
+import functools
+import io
 import lxml.etree
 import os
 import pyRestTable
 import re
 import sys
-from local_utilities import printf, replicate
+from local_utilities import replicate
 
 
 INDENTATION_UNIT = '  '
+HTML_ROOT = 'https://github.com/nexusformat/definitions/blob/main'
+
+# NXDL category: listing category
+LISTING_CATEGORIES = {
+    'base': 'base class',
+    'application': 'application definition',
+    'contributed': 'contributed definition',
+}
+# NXDL category: source directory
+SUBDIR_MAP = {
+    'base': 'base_classes',
+    'application': 'applications',
+    'contributed': 'contributed_definitions',
+}
+
+# The following URL is outdated, but that doesn't matter;
+# it won't be accessed; it's just an arbitrary namespace name.
+# It only needs to match the xmlns attribute in the NXDL files.
+NAMESPACE = 'http://definition.nexusformat.org/nxdl/3.1'
+
+# Clark-notation tags: direct child lookups with findall() bypass XPath
+_ATTRIBUTE_TAG = '{%s}attribute' % NAMESPACE
+_DIM_TAG = '{%s}dim' % NAMESPACE
+_DIMENSIONS_TAG = '{%s}dimensions' % NAMESPACE
+_DOC_TAG = '{%s}doc' % NAMESPACE
+_ENUMERATION_TAG = '{%s}enumeration' % NAMESPACE
+_FIELD_TAG = '{%s}field' % NAMESPACE
+_GROUP_TAG = '{%s}group' % NAMESPACE
+_ITEM_TAG = '{%s}item' % NAMESPACE
+_LINK_TAG = '{%s}link' % NAMESPACE
+_SYMBOL_TAG = '{%s}symbol' % NAMESPACE
+_SYMBOLS_TAG = '{%s}symbols' % NAMESPACE
+
+# XML comments are not documentation: drop them while parsing.
+# NXDL does not use xml:id, so skip building the ID lookup table.
+_PARSER = lxml.etree.XMLParser(remove_comments=True, collect_ids=False)
+
+# regular expressions used for every <doc> element
+_BLOCK_SPLIT_RE = re.compile(r'\n\s*\n')
+_INDENT_RE = re.compile(r'(\s*)(\S+)')
+_TAB_RE = re.compile(r'\t')
+_NL_RE = re.compile(r'\n')
+
 listing_category = None
 anchor_list = []  # list of all hypertext anchors
+_rst_lines = io.StringIO()  # reST output, written to stdout once per NXDL file
+
+
+def _emit(text, end='\n'):
+    """Add formatted text to the reST output buffer."""
+    _rst_lines.write(text)
+    _rst_lines.write(end)
 
 
 def addAnchor(anchor):
@@ -35,10 +86,10 @@ def printAnchorList():
         return key.lower()
 
     if len(anchor_list) > 0:
-        print("")
-        print("Hypertext Anchors")
-        print("-----------------\n")
-        print(
+        _emit("")
+        _emit("Hypertext Anchors")
+        _emit("-----------------\n")
+        _emit(
             "Table of hypertext anchors for all groups, fields,\n"
             "attributes, and links defined in this class.\n\n"
         )
@@ -62,12 +113,12 @@ def printAnchorList():
                 )
             )
             # fmt: on
-        print(table)
+        _emit(str(table))
 
 
 def fmtTyp( node ):
     typ = node.get('type', ':ref:`NX_CHAR <NX_CHAR>`') # per default
-    if typ.startswith('NX_'):
+    if typ[:3] == 'NX_':
         typ = ':ref:`%s <%s>`' % (typ, typ)
     return typ
 
@@ -76,13 +127,13 @@ def fmtUnits( node ):
     units = node.get('units', '')
     if not units:
         return ''
-    if units.startswith('NX_'):
+    if units[:3] == 'NX_':
         units = '\ :ref:`%s <%s>`' % (units, units)
     return ' {units=%s}' % units
 
 
-def getDocBlocks( ns, node ):
-    docnodes = node.xpath('nx:doc', namespaces=ns)
+def getDocBlocks( node ):
+    docnodes = node.findall(_DOC_TAG)
     if docnodes is None or len(docnodes)==0:
         return ''
     if len(docnodes) > 1:
@@ -92,29 +143,26 @@ def getDocBlocks( ns, node ):
 
     # be sure to grab _all_ content in the documentation
     # it might look like XML
-    s = lxml.etree.tostring(docnode, pretty_print=True,
-                            method='c14n', with_comments=False).decode('utf-8')
-    m = re.search(r'^<doc[^>]*>\n?(.*)\n?</doc>$', s, re.DOTALL )
-    if not m:
-        raise Exception( 'unexpected docstring [%s] ' % s )
-    text = m.group(1)
+    s = lxml.etree.tostring(docnode, encoding='unicode', with_tail=False)
+    if s.endswith('/>'):
+        text = ''   # empty <doc/>
+    else:
+        # strip the enclosing <doc> tags and one newline after the start tag
+        text = s[s.index('>')+1:s.rindex('</')]
+        if text[:1] == '\n':
+            text = text[1:]
 
     # substitute HTML entities in markup: "<" for "&lt;"
     # thanks: http://stackoverflow.com/questions/2087370/decode-html-entities-in-python-string
-    htmlparser = HTMLParser.HTMLParser()
-    try:		# see #661
-        import html
-        text = html.unescape(text)
-    except (ImportError, AttributeError):
-        text = htmlparser.unescape(text)
+    text = _html_unescape(text)
 
     # Blocks are separated by whitelines
-    blocks = re.split( '\n\s*\n', text )
+    blocks = _BLOCK_SPLIT_RE.split(text)
     if len(blocks)==1 and len(blocks[0].splitlines())==1:
         return [ blocks[0].rstrip().lstrip() ]
 
     # Indentation must be given by first line
-    m = re.match(r'(\s*)(\S+)', blocks[0])
+    m = _INDENT_RE.match(blocks[0])
     if not m:
         return [ '' ]
     indent = m.group(1)
@@ -132,22 +180,22 @@ def getDocBlocks( ns, node ):
             if line[:len(indent)]!=indent:
                 raise Exception( 'Bad indentation in <doc> of %s [%s]: expected "%s" found "%s".' %
                                  ( node.get('name'), block,
-                                   re.sub(r'\t',"\\\\t", indent ),
-                                   re.sub(r'\t',"\\\\t", line ),
+                                   _TAB_RE.sub("\\\\t", indent ),
+                                   _TAB_RE.sub("\\\\t", line ),
                             ) )
             out_lines.append( line[len(indent):] )
         out_blocks.append( "\n".join(out_lines) )
     return out_blocks
 
 
-def getDocLine( ns, node ):
-    blocks = getDocBlocks( ns, node )
+def getDocLine( node ):
+    blocks = getDocBlocks( node )
     if len(blocks)==0:
         return ''
     if len(blocks)>1:
         raise Exception( 'Unexpected multi-paragraph doc [%s]' %
                          '|'.join(blocks) )
-    return re.sub(r'\n', " ", blocks[0])
+    return _NL_RE.sub(" ", blocks[0])
 
 
 def get_minOccurs(node, use_application_defaults):
@@ -172,13 +220,28 @@ def get_required_or_optional_text(node, use_application_defaults):
     :param bool use_application_defaults: use special case value
     :returns: formatted text
     '''
-    tag = node.tag.split('}')[-1]
-    nm = node.get('name')
+    return _optional_text(
+        node.tag.split('}')[-1],
+        get_minOccurs(node, use_application_defaults),
+        node.get('optional'),
+        node.get('recommended'),
+        use_application_defaults)
+
+
+@functools.lru_cache(maxsize=None)
+def _optional_text(tag, minOccurs, optional, recommended, use_application_defaults):
+    '''
+    formatted text for :func:`get_required_or_optional_text`
+
+    The result depends only on the tag and a few attribute values
+    (``None`` if absent), so each of the few possible combinations
+    is computed just once.
+    '''
+    if optional is None:
+        optional = not use_application_defaults
+    optional = optional in (True, 'true', '1', 1)
+    recommended = recommended in (True, 'true', '1', 1)
     if tag in ('field', 'group'):
-        optional_default = not use_application_defaults
-        optional = node.get('optional', optional_default) in (True, 'true', '1', 1)
-        recommended = node.get('recommended', None) in (True, 'true', '1', 1)
-        minOccurs = get_minOccurs(node, use_application_defaults)
         if minOccurs in ('0', 0) or optional:
             optional_text = '(optional) '
         elif recommended:
@@ -190,9 +253,6 @@ def get_required_or_optional_text(node, use_application_defaults):
             # TODO: add a remark to the log
             optional_text = '(``minOccurs=%s``) ' % str(minOccurs)
     elif tag in ('attribute',):
-        optional_default = not use_application_defaults
-        optional = node.get('optional', optional_default) in (True, 'true', '1', 1)
-        recommended = node.get('recommended', None) in (True, 'true', '1', 1)
         optional_text = {True: '(optional) ', False: '(required) '}[optional]
         if recommended:
             optional_text = '(recommended) '
@@ -201,19 +261,16 @@ def get_required_or_optional_text(node, use_application_defaults):
     return optional_text
 
 
-def analyzeDimensions( ns, parent ):
-    node_list = parent.xpath('nx:dimensions', namespaces=ns)
+def analyzeDimensions( parent ):
+    node_list = parent.findall(_DIMENSIONS_TAG)
     if len(node_list) != 1:
         return ''
     node = node_list[0]
     # rank = node.get('rank') # ignore this
-    node_list = node.xpath('nx:dim', namespaces=ns)
-    dims = []
-    for subnode in node_list:
-        value = subnode.get('value')
-        if not value:
-            value = 'ref(%s)' % subnode.get('ref')
-        dims.append( value )
+    dims = [
+        subnode.get('value') or 'ref(%s)' % subnode.get('ref')
+        for subnode in node.iterchildren(_DIM_TAG)
+    ]
     return '[%s]' % ( ', '.join(dims) )
 
 
@@ -230,20 +287,20 @@ def hyperlinkTarget(parent_path, name, nxtype):
     return ".. _%s:\n" % target
 
 
-def printEnumeration( indent, ns, parent ):
-    node_list = parent.xpath('nx:item', namespaces=ns)
+def printEnumeration( indent, parent ):
+    node_list = parent.findall(_ITEM_TAG)
     if len(node_list) == 0:
         return ''
 
     if len(node_list) == 1:
-        printf('%sObligatory value:', indent)
+        _emit('%sObligatory value:' % indent, end='')
     else:
-        printf('%sAny of these values:', indent)
+        _emit('%sAny of these values:' % indent, end='')
 
-    docs = OrderedDict()
+    docs = {}
     for item in node_list:
         name = item.get('value')
-        docs[name] = getDocLine(ns, item)
+        docs[name] = getDocLine(item)
 
     ENUMERATION_INLINE_LENGTH = 60
     def show_as_typed_text(msg):
@@ -252,59 +309,58 @@ def printEnumeration( indent, ns, parent ):
     if ( any( doc for doc in docs.values() ) or
          len( oneliner ) > ENUMERATION_INLINE_LENGTH ):
         # print one item per line
-        print('\n')
+        _emit('\n')
         for name, doc in docs.items():
-            printf('%s  * %s', indent, show_as_typed_text(name))
+            _emit('%s  * %s' % (indent, show_as_typed_text(name)), end='')
             if doc:
-                printf(': %s', doc)
-            print('\n')
+                _emit(': %s' % doc, end='')
+            _emit('\n')
     else:
         # print all items in one line
-        print(' %s' % ( oneliner ) )
-    print('')
+        _emit(' %s' % ( oneliner ) )
+    _emit('')
 
 
-def printDoc( indent, ns, node, required=False):
-    blocks = getDocBlocks(ns, node)
+def printDoc( indent, node, required=False):
+    blocks = getDocBlocks(node)
     if len(blocks)==0:
         if required:
             raise Exception( 'No documentation for: ' + node.get('name') )
-        print('')
+        _emit('')
     else:
         for block in blocks:
             for line in block.splitlines():
-                print( '%s%s' % ( indent, line ) )
-            print()
+                _emit( '%s%s' % ( indent, line ) )
+            _emit('')
 
 
-def printAttribute( ns, kind, node, optional, indent, parent_path ):
+def printAttribute( kind, node, optional, indent, parent_path ):
     name = node.get('name')
     index_name = name
-    print("%s%s" % (indent, hyperlinkTarget(parent_path, name, 'attribute'))
+    _emit("%s%s" % (indent, hyperlinkTarget(parent_path, name, 'attribute'))
     )
-    print( '%s.. index:: %s (%s attribute)\n' %
+    _emit( '%s.. index:: %s (%s attribute)\n' %
            ( indent, index_name, kind ) )
-    print( '%s**@%s**: %s%s%s\n' % (
+    _emit( '%s**@%s**: %s%s%s\n' % (
         indent, name, optional, fmtTyp(node), fmtUnits(node) ) )
-    printDoc(indent+INDENTATION_UNIT, ns, node)
-    node_list = node.xpath('nx:enumeration', namespaces=ns)
+    printDoc(indent+INDENTATION_UNIT, node)
+    node_list = node.findall(_ENUMERATION_TAG)
     if len(node_list) == 1:
-        printEnumeration( indent+INDENTATION_UNIT, ns, node_list[0] )
+        printEnumeration( indent+INDENTATION_UNIT, node_list[0] )
 
 
-def printIfDeprecated( ns, node, indent ):
+def printIfDeprecated( node, indent ):
     deprecated = node.get('deprecated', None)
     if deprecated is not None:
-        print( '\n%s.. index:: deprecated\n' % indent)
+        _emit( '\n%s.. index:: deprecated\n' % indent)
         fmt = '\n%s**DEPRECATED**: %s\n'
-        print( fmt % (indent, deprecated ) )
+        _emit( fmt % (indent, deprecated ) )
 
 
-def printFullTree(ns, parent, name, indent, parent_path):
+def printFullTree(parent, name, indent, parent_path):
     '''
     recursively print the full tree structure
 
-    :param dict ns: dictionary of namespaces for use in XPath expressions
     :param lxml_element_node parent: parent node to be documented
     :param str name: name of elements, such as NXentry/NXuser
     :param indent: to keep track of indentation level
@@ -316,74 +372,78 @@ def printFullTree(ns, parent, name, indent, parent_path):
         'application definition',
         'contributed definition')
 
-    for node in parent.xpath('nx:field', namespaces=ns):
+    # sort the children in a single pass, then print fields, groups, links
+    fields, groups, links = [], [], []
+    buckets = {_FIELD_TAG: fields, _GROUP_TAG: groups, _LINK_TAG: links}
+    for node in parent:
+        bucket = buckets.get(node.tag)
+        if bucket is not None:
+            bucket.append(node)
+
+    for node in fields:
         name = node.get('name')
         index_name = name
-        dims = analyzeDimensions(ns, node)
+        dims = analyzeDimensions(node)
 
         optional_text = get_required_or_optional_text(node, use_application_defaults)
-        print("%s%s" % (indent, hyperlinkTarget(parent_path, name, 'field')))
-        print( '%s.. index:: %s (field)\n' %
+        _emit("%s%s" % (indent, hyperlinkTarget(parent_path, name, 'field')))
+        _emit( '%s.. index:: %s (field)\n' %
                ( indent, index_name ) )
-        print(
+        _emit(
             '%s**%s%s**: %s%s%s\n' % (
                 indent, name, dims, optional_text, fmtTyp(node), fmtUnits(node)
                 ))
 
-        printIfDeprecated( ns, node, indent+INDENTATION_UNIT )
-        printDoc(indent+INDENTATION_UNIT, ns, node)
+        printIfDeprecated( node, indent+INDENTATION_UNIT )
+        printDoc(indent+INDENTATION_UNIT, node)
 
-        node_list = node.xpath('nx:enumeration', namespaces=ns)
+        node_list = node.findall(_ENUMERATION_TAG)
         if len(node_list) == 1:
-            printEnumeration( indent+INDENTATION_UNIT, ns, node_list[0] )
+            printEnumeration( indent+INDENTATION_UNIT, node_list[0] )
 
-        for subnode in node.xpath('nx:attribute', namespaces=ns):
+        for subnode in node.findall(_ATTRIBUTE_TAG):
             optional = get_required_or_optional_text(subnode, use_application_defaults)
-            printAttribute( ns, 'field', subnode, optional, indent+INDENTATION_UNIT, parent_path+"/"+name )
+            printAttribute( 'field', subnode, optional, indent+INDENTATION_UNIT, parent_path+"/"+name )
 
-    for node in parent.xpath('nx:group', namespaces=ns):
+    for node in groups:
         name = node.get('name', '')
-        typ = node.get('type', 'untyped (this is an error; please report)')
+        nxclass = node.get('type')
+        typ = nxclass if nxclass is not None else 'untyped (this is an error; please report)'
 
         optional_text = get_required_or_optional_text(node, use_application_defaults)
-        if typ.startswith('NX'):
+        if typ[:2] == 'NX':
             if name == '':
                 name = typ.lstrip('NX').upper()
             typ = ':ref:`%s`' % typ
-        print("%s%s" % (indent, hyperlinkTarget(parent_path, name, 'group')))
-        print( '%s**%s**: %s%s\n' % (indent, name, optional_text, typ ) )
+        _emit("%s%s" % (indent, hyperlinkTarget(parent_path, name, 'group')))
+        _emit( '%s**%s**: %s%s\n' % (indent, name, optional_text, typ ) )
 
-        printIfDeprecated(ns, node, indent+INDENTATION_UNIT)
-        printDoc(indent+INDENTATION_UNIT, ns, node)
+        printIfDeprecated(node, indent+INDENTATION_UNIT)
+        printDoc(indent+INDENTATION_UNIT, node)
 
-        for subnode in node.xpath('nx:attribute', namespaces=ns):
+        for subnode in node.findall(_ATTRIBUTE_TAG):
             optional = get_required_or_optional_text(subnode, use_application_defaults)
-            printAttribute( ns, 'group', subnode, optional, indent+INDENTATION_UNIT, parent_path+"/"+name )
+            printAttribute( 'group', subnode, optional, indent+INDENTATION_UNIT, parent_path+"/"+name )
 
-        nodename = '%s/%s' % (name, node.get('type'))
-        printFullTree(ns, node, nodename, indent+INDENTATION_UNIT, parent_path+"/"+name)
+        nodename = '%s/%s' % (name, nxclass)
+        printFullTree(node, nodename, indent+INDENTATION_UNIT, parent_path+"/"+name)
 
-    for node in parent.xpath('nx:link', namespaces=ns):
+    for node in links:
         name = node.get('name')
-        print("%s%s" % (indent, hyperlinkTarget(parent_path, name, 'link')))
-        print( '%s**%s**: :ref:`link<Design-Links>` (suggested target: ``%s``)\n' % (
+        _emit("%s%s" % (indent, hyperlinkTarget(parent_path, name, 'link')))
+        _emit( '%s**%s**: :ref:`link<Design-Links>` (suggested target: ``%s``)\n' % (
             indent, name, node.get('target') ) )
-        printDoc(indent+INDENTATION_UNIT, ns, node)
+        printDoc(indent+INDENTATION_UNIT, node)
 
 
 def print_rst_from_nxdl(nxdl_file):
     '''
     print restructured text from the named .nxdl.xml file
     '''
-    global listing_category
+    global listing_category, _rst_lines
+    _rst_lines = io.StringIO()
     # parse input file into tree
-    tree = lxml.etree.parse(nxdl_file)
-
-    # The following URL is outdated, but that doesn't matter;
-    # it won't be accessed; it's just an arbitrary namespace name.
-    # It only needs to match the xmlns attribute in the NXDL files.
-    NAMESPACE = 'http://definition.nexusformat.org/nxdl/3.1'
-    ns = {'nx': NAMESPACE}
+    tree = lxml.etree.parse(nxdl_file, parser=_PARSER)
 
     root = tree.getroot()
     name = root.get('name')
@@ -398,30 +458,26 @@ def print_rst_from_nxdl(nxdl_file):
     #subdir = os.path.split(os.path.split(tree.docinfo.URL)[0])[1]
     subdir = root.attrib["category"]
     # TODO: check for consistency with root.get('category')
-    listing_category = {
-                 'base': 'base class',
-                 'application': 'application definition',
-                 'contributed': 'contributed definition',
-                 }[subdir]
+    listing_category = LISTING_CATEGORIES[subdir]
 
     use_application_defaults = listing_category in (
         'application definition',
         'contributed definition')
 
     # print ReST comments and section header
-    print( '.. auto-generated by script %s from the NXDL source %s' %
+    _emit( '.. auto-generated by script %s from the NXDL source %s' %
            (sys.argv[0], sys.argv[1]) )
-    print('')
-    print( '.. index::' )
-    print( '    ! %s (%s)' % (name,listing_category) )
-    print( '    ! %s (%s)' % (lexical_name,listing_category) )
-    print( '    see: %s (%s); %s' %
+    _emit('')
+    _emit( '.. index::' )
+    _emit( '    ! %s (%s)' % (name,listing_category) )
+    _emit( '    ! %s (%s)' % (lexical_name,listing_category) )
+    _emit( '    see: %s (%s); %s' %
            (lexical_name,listing_category, name) )
-    print('')
-    print( '.. _%s:\n' % name )
-    print( '='*len(title) )
-    print( title )
-    print( '='*len(title) )
+    _emit('')
+    _emit( '.. _%s:\n' % name )
+    _emit( '='*len(title) )
+    _emit( title )
+    _emit( '='*len(title) )
 
     # print category & parent class
     extends = root.get('extends')
@@ -430,76 +486,69 @@ def print_rst_from_nxdl(nxdl_file):
     else:
         extends = ':ref:`%s`' % extends
 
-    print('')
-    print( '**Status**:\n' )
-    print( '  %s, extends %s' %
+    _emit('')
+    _emit( '**Status**:\n' )
+    _emit( '  %s, extends %s' %
            ( listing_category.strip(),
              extends ) )
 
-    printIfDeprecated(ns, root, '')
+    printIfDeprecated(root, '')
 
     # print official description of this class
-    print('')
-    print( '**Description**:\n' )
-    printDoc(INDENTATION_UNIT, ns, root, required=True)
+    _emit('')
+    _emit( '**Description**:\n' )
+    printDoc(INDENTATION_UNIT, root, required=True)
 
 
     # print symbol list
-    node_list = root.xpath('nx:symbols', namespaces=ns)
-    print( '**Symbols**:\n' )
+    node_list = root.findall(_SYMBOLS_TAG)
+    _emit( '**Symbols**:\n' )
     if len(node_list) == 0:
-        print( '  No symbol table\n' )
+        _emit( '  No symbol table\n' )
     elif len(node_list) > 1:
         raise Exception( 'Invalid symbol table in ' % root.get('name') )
     else:
-        printDoc( INDENTATION_UNIT, ns, node_list[0] )
-        for node in node_list[0].xpath('nx:symbol', namespaces=ns):
-            doc = getDocLine(ns, node)
-            printf('  **%s**', node.get('name'))
+        printDoc( INDENTATION_UNIT, node_list[0] )
+        for node in node_list[0].findall(_SYMBOL_TAG):
+            doc = getDocLine(node)
+            _emit('  **%s**' % node.get('name'), end='')
             if doc:
-                printf(': %s', doc)
-            print('\n')
+                _emit(': %s' % doc, end='')
+            _emit('\n')
 
     # print group references
-    print( '**Groups cited**:' )
-    node_list = root.xpath('//nx:group', namespaces=ns)
-    groups = []
-    for node in node_list:
-        g = node.get('type')
-        if g.startswith('NX') and g not in groups:
-            groups.append(g)
+    _emit( '**Groups cited**:' )
+    group_types = (node.get('type') for node in root.iter(_GROUP_TAG))
+    # unique, in order of first appearance
+    groups = list(dict.fromkeys(g for g in group_types if g[:2] == 'NX'))
     if len(groups) == 0:
-        print( '  none\n' )
+        _emit( '  none\n' )
     else:
         out = [ (':ref:`%s`' % g) for g in groups ]
         txt = ', '.join(sorted(out))
-        print( '  %s\n' % ( txt ) )
+        _emit( '  %s\n' % ( txt ) )
         out = [ ('%s (base class); used in %s' % (g, listing_category)) for g in groups ]
         txt = ', '.join(out)
-        print( '.. index:: %s\n' % ( txt ) )
+        _emit( '.. index:: %s\n' % ( txt ) )
 
     # TODO: change instances of \t to proper indentation
-    html_root = 'https://github.com/nexusformat/definitions/blob/main'
 
     # print full tree
-    print( '**Structure**:\n' )
-    for subnode in root.xpath('nx:attribute', namespaces=ns):
+    _emit( '**Structure**:\n' )
+    for subnode in root.findall(_ATTRIBUTE_TAG):
         optional = get_required_or_optional_text(subnode, use_application_defaults)
-        printAttribute( ns, 'file', subnode, optional, INDENTATION_UNIT, parent_path) # FIXME: +"/"+name )
-    printFullTree(ns, root, name, INDENTATION_UNIT, parent_path)
+        printAttribute( 'file', subnode, optional, INDENTATION_UNIT, parent_path) # FIXME: +"/"+name )
+    printFullTree(root, name, INDENTATION_UNIT, parent_path)
 
     printAnchorList()
 
     # print NXDL source location
-    subdir_map = {
-                  'base': 'base_classes',
-                  'application': 'applications',
-                  'contributed': 'contributed_definitions',
-                  }
-    print("")
-    print( '**NXDL Source**:' )
-    print( '  %s/%s/%s.nxdl.xml' % (
-        html_root, subdir_map[subdir], name) )
+    _emit("")
+    _emit( '**NXDL Source**:' )
+    _emit( '  %s/%s/%s.nxdl.xml' % (
+        HTML_ROOT, SUBDIR_MAP[subdir], name) )
+
+    sys.stdout.write(_rst_lines.getvalue())
 
 
 def main():
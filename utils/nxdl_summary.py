@@ -103,7 +103,7 @@ def getSummary(nxdl_file):
     if len(nodes) != 1:
         raise RuntimeError('wrong number of <doc> nodes in NXDL: ' + nxdl_file)
     text = nodes[0].text
-    return text.strip().splitlines()[0]
+    return text.strip().partition('\n')[0]
 
 
 def command_args():